@@ -8,18 +8,25 @@ Module that contains classes to define Dcc tools
 from __future__ import annotations
 
 import sys
+import types
 import typing
+import keyword
+import weakref
+import operator
 import traceback
-from typing import Iterator, Any
-from dataclasses import dataclass, field
+from collections import deque
+from functools import lru_cache
+from typing import Iterator, Sequence, Callable, Any
+from dataclasses import dataclass, field, fields
 
 from Qt.QtCore import Signal
 
 from tp.core import log
 from tp.dcc import callback
+from tp.dcc.collections.weakref import WeakRefList
 from tp.common.python import helpers, decorators
 from tp.common import plugin
-from tp.common.qt import api as qt
+from tp.common.qt import api as qt, qtutils
 
 if typing.TYPE_CHECKING:
     from tp.core.managers.tools import ToolsManager
@@ -27,6 +34,29 @@ if typing.TYPE_CHECKING:
 logger = log.tpLogger
 
 
+def _slots(*extra_slots: str) -> Callable[[type], type]:
+    """
+    Decorator that recreates a dataclass with __slots__ for all its fields (same as dataclass(slots=True), which is
+    not available in Python versions older than 3.10).
+
+    :param str extra_slots: additional slots to add (for example, '__dict__' to still allow dynamic attributes).
+    :return: decorator function.
+    :rtype: Callable[[type], type]
+    """
+
+    def _wrapper(cls: type) -> type:
+        field_names = tuple(dataclass_field.name for dataclass_field in fields(cls))
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = field_names + extra_slots
+        for field_name in field_names:
+            cls_dict.pop(field_name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    return _wrapper
+
+
 @dataclass()
 class UiData:
     label: str = ''
@@ -35,6 +65,7 @@ class UiData:
     auto_link_properties: bool = False
 
 
+@_slots('__dict__')
 @dataclass()
 class UiProperty:
     name: str
@@ -42,30 +73,130 @@ class UiProperty:
     default: Any = None
 
 
+@_slots()
 @dataclass()
 class UiPropertyGetSet:
     getter: str
     setter: str
 
+    def __post_init__(self):
+        self.getter = sys.intern(self.getter)
+        self.setter = sys.intern(self.setter)
+
+
+# generated widget functions, shared between all widget update infos with the same getter/setter ops
+_WIDGET_FUNCTIONS: dict[tuple[tuple[str, str, str], ...], tuple[Callable, Callable]] = {}
 
+
+def _widget_functions(
+        ops: tuple[tuple[str, str, str], ...]) -> tuple[Callable[[qt.QWidget, UiProperty], None],
+                                                        Callable[[qt.QWidget], dict[str, Any]]]:
+    """
+    Internal function that generates the functions that apply UI property values into a widget and that read the
+    values of a widget for the given getter/setter ops. Generated functions call widget getters/setters directly, so
+    no generic loop is executed each time a widget is saved or updated. If a setter raises a TypeError, the apply
+    function raises a new TypeError with the name of the property, the failing setter and the value it was given.
+
+    :param tuple[tuple[str, str, str], ...] ops: tuple of (property key, getter name, setter name) tuples.
+    :return: tuple with the apply and read functions.
+    :rtype: tuple[Callable[[qt.QWidget, UiProperty], None], Callable[[qt.QWidget], dict[str, Any]]]
+    :raises ValueError: if any of the property keys, getter or setter names is not a valid identifier or is a keyword.
+    """
+
+    functions = _WIDGET_FUNCTIONS.get(ops)
+    if functions is not None:
+        return functions
+
+    for names in ops:
+        for name in names:
+            if not name.isidentifier() or keyword.iskeyword(name):
+                raise ValueError(f'Invalid widget getter/setter name: "{name}"')
+
+    apply_lines: list[str] = []
+    for prop_key, _, setter_name in ops:
+        apply_lines.extend([
+            f'    value = ui_property.{prop_key}',
+            '    try:',
+            f'        widget.{setter_name}(value)',
+            '    except TypeError as err:',
+            '        raise TypeError(',
+            f"            f'Unable to set widget attribute method: {{ui_property.name}}; property: {setter_name}; '",
+            "            f'value: {value}: {err}')"])
+    read_items = ', '.join(f'{prop_key!r}: widget.{getter_name}()' for prop_key, getter_name, _ in ops)
+    source = '\n'.join([
+        'def apply(widget, ui_property):',
+        *(apply_lines or ['    pass']),
+        '',
+        'def read(widget):',
+        f'    return {{{read_items}}}',
+        ''])
+    namespace: dict[str, Callable] = {}
+    exec(compile(source, f'<{__name__} widget functions>', 'exec'), namespace)
+    functions = _WIDGET_FUNCTIONS[ops] = namespace['apply'], namespace['read']
+
+    return functions
+
+
+@_slots()
 @dataclass()
 class UiPropertyWidgetUpdate:
     save_signal: str
-    getsets: list[UiPropertyGetSet] = field(default_factory=lambda: [])
+    getsets: Sequence[UiPropertyGetSet] = field(default_factory=list)
     skip_children: bool = True
+    inherit: bool = False
+    signal_getter: Callable[[qt.QWidget], Signal] = field(init=False, repr=False, compare=False)
+    ops: tuple[tuple[str, str, str], ...] = field(init=False, repr=False, compare=False)
+    apply: Callable[[qt.QWidget, UiProperty], None] = field(init=False, repr=False, compare=False)
+    read: Callable[[qt.QWidget], dict[str, Any]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.save_signal = sys.intern(self.save_signal)
+        self.signal_getter = operator.attrgetter(self.save_signal)
+        self.ops = tuple(
+            ('value' if i == 0 else getset.getter, getset.getter, getset.setter)
+            for i, getset in enumerate(self.getsets))
+        self.apply, self.read = _widget_functions(self.ops)
+
+
+_SUPPORT_WIDGET_TYPES: dict[type, UiPropertyWidgetUpdate] = {
+    qt.ComboBoxRegularWidget: UiPropertyWidgetUpdate(
+        'itemChanged', (UiPropertyGetSet('current_index', 'set_index'),), inherit=True),
+    qt.RadioButtonGroup: UiPropertyWidgetUpdate('toggled', (UiPropertyGetSet('checked_index', 'set_checked'),)),
+    qt.SearchLineEdit: UiPropertyWidgetUpdate('textChanged', (UiPropertyGetSet('text', 'setText'),)),
+    qt.BaseLineEdit: UiPropertyWidgetUpdate('textChanged', (UiPropertyGetSet('text', 'setText'),)),
+    qt.StringLineEditWidget: UiPropertyWidgetUpdate('textChanged', (UiPropertyGetSet('text', 'set_text'),)),
+    qt.FloatLineEditWidget: UiPropertyWidgetUpdate('textChanged', (UiPropertyGetSet('value', 'set_value'),)),
+    qt.IntLineEditWidget: UiPropertyWidgetUpdate('textChanged', (UiPropertyGetSet('value', 'set_value'),)),
+    qt.QLineEdit: UiPropertyWidgetUpdate('textChanged', (UiPropertyGetSet('text', 'setText'),)),
+    qt.QCheckBox: UiPropertyWidgetUpdate('toggled', (UiPropertyGetSet('isChecked', 'setChecked'),), inherit=True)
+}
 
+# read-only view of the supported widget types, which are never modified after import
+SUPPORT_WIDGET_TYPES = types.MappingProxyType(_SUPPORT_WIDGET_TYPES)
 
-SUPPORT_WIDGET_TYPES = {
-    qt.ComboBoxRegularWidget: UiPropertyWidgetUpdate('itemChanged', [UiPropertyGetSet('current_index', 'set_index')]),
-    qt.RadioButtonGroup: UiPropertyWidgetUpdate('toggled', [UiPropertyGetSet('checked_index', 'set_checked')]),
-    qt.SearchLineEdit: UiPropertyWidgetUpdate('textChanged', [UiPropertyGetSet('text', 'setText')]),
-    qt.BaseLineEdit: UiPropertyWidgetUpdate('textChanged', [UiPropertyGetSet('text', 'setText')]),
-    qt.StringLineEditWidget: UiPropertyWidgetUpdate('textChanged', [UiPropertyGetSet('text', 'set_text')]),
-    qt.FloatLineEditWidget: UiPropertyWidgetUpdate('textChanged', [UiPropertyGetSet('value', 'set_value')]),
-    qt.IntLineEditWidget: UiPropertyWidgetUpdate('textChanged', [UiPropertyGetSet('value', 'set_value')]),
-    qt.QLineEdit: UiPropertyWidgetUpdate('textChanged', [UiPropertyGetSet('text', 'setText')]),
-    qt.QCheckBox: UiPropertyWidgetUpdate('toggled', [UiPropertyGetSet('isChecked', 'setChecked')])
-}
+
+@lru_cache(maxsize=None)
+def _widget_info_for(widget_type: type) -> UiPropertyWidgetUpdate | None:
+    """
+    Internal function that returns the widget update info registered for the given widget type. Subclasses only
+    resolve to the info of their closest registered base class if that info allows it (inherit is True), because
+    subclasses usually have their own value API. Result is cached per type, so the MRO is only walked once.
+
+    :param type widget_type: widget type to get update info of.
+    :return: widget update info.
+    :rtype: UiPropertyWidgetUpdate or None
+    """
+
+    widget_info = SUPPORT_WIDGET_TYPES.get(widget_type)
+    if widget_info is not None:
+        return widget_info
+
+    for base_type in widget_type.__mro__[1:]:
+        widget_info = SUPPORT_WIDGET_TYPES.get(base_type)
+        if widget_info is not None and widget_info.inherit:
+            return widget_info
+
+    return None
 
 
 class Tool(qt.QObject):
@@ -85,7 +216,9 @@ class Tool(qt.QObject):
         self._tools_manager = tools_manager
         self._widgets: list[qt.QWidget] = []
         self._properties: helpers.ObjectDict[str, UiProperty] = self.setup_properties()
-        self._listeners: dict[str, callable] = {}
+        self._listeners: dict[str, list[Callable] | tuple[Callable, ...]] = {}
+        self._property_widgets = WeakRefList()
+        self._widgets_by_prop: dict[str, WeakRefList] = {}
         self._stacked_widget: qt.QStackedWidget | None = None
         self._show_warnings: bool = True
         self._block_save: bool = False
@@ -151,6 +284,7 @@ class Tool(qt.QObject):
     def properties(self) -> helpers.ObjectDict:
         """
         Getter method that returns dictionary containing all available UI properties for this tool.
+        Returned dictionary allows attribute-style access to UI properties (for example, self.properties.my_property).
 
         :return: UI properties dictionary.
         :rtype: helpers.ObjectDict
@@ -179,13 +313,18 @@ class Tool(qt.QObject):
         :rtype: str
         """
 
-        return widget.property('prop')
+        return getattr(widget, '_ui_prop_name', None) or widget.property('prop')
 
     def execute(self, *args, **kwargs):
         """
         Main function that runs tool.
         """
 
+        # widgets from previous executions are not part of the new UI
+        self._widgets.clear()
+        self._property_widgets = WeakRefList()
+        self._widgets_by_prop.clear()
+
         win = qt.FramelessWindow()
         win.closed.connect(self.closed.emit)
         win.set_title(self.ui_data.label)
@@ -202,6 +341,7 @@ class Tool(qt.QObject):
 
         self.populate_widgets()
         self.post_content_setup()
+        self.freeze_listeners()
         self.update_widgets_from_properties()
         self.save_properties()
 
@@ -236,19 +376,19 @@ class Tool(qt.QObject):
         :param bool update_widgets: whether to update widgets after resetting UI propreties.
         """
 
-        for ui_property in self.properties.values():
+        for ui_property in self._properties.values():
             ui_property.value = ui_property.default
 
         if update_widgets:
             self.update_widgets_from_properties()
 
-    def setup_properties(self, properties: helpers.ObjectDict | None = None) -> helpers.ObjectDict:
+    def setup_properties(self, properties: list[UiProperty] | None = None) -> helpers.ObjectDict:
         """
         Initializes all UI properties.
 
-        :param UiPropertiesDict or None properties: optional initial properties.
+        :param list[UiProperty] or None properties: optional initial properties.
         :return: dictionary containing all UI properties.
-        :rtype: UiPropertiesDict
+        :rtype: helpers.ObjectDict
         """
 
         properties = properties or self.initialize_properties()
@@ -272,7 +412,7 @@ class Tool(qt.QObject):
         names: list[str] = []
 
         for name, widget in self.iterate_linkable_properties(self._stacked_widget):
-            skip_children = SUPPORT_WIDGET_TYPES.get(type(widget)).skip_children
+            skip_children = _widget_info_for(type(widget)).skip_children
             widget.setProperty('skipChildren', skip_children)
             if not self.link_property(widget, name):
                 continue
@@ -285,11 +425,13 @@ class Tool(qt.QObject):
                 names.append(name)
 
         new_props = self.setup_properties(new_properties)
-        self.properties.update(new_props)
+        self._properties.update(new_props)
 
         for ui_property in new_properties:
-            for listener in self._listeners.get(ui_property.name, []):
-                listener(ui_property.value)
+            listeners = self._listeners.get(ui_property.name)
+            if listeners:
+                for listener in listeners:
+                    listener(ui_property.value)
 
     def link_property(self, widget: qt.QWidget, ui_property_name: str) -> bool:
         """
@@ -303,6 +445,7 @@ class Tool(qt.QObject):
 
         if self.widget_property_name(widget) is None:
             widget.setProperty('prop', ui_property_name)
+            self._register_property_widget(widget, ui_property_name)
             return True
 
         return False
@@ -310,58 +453,64 @@ class Tool(qt.QObject):
     def iterate_linkable_properties(self, widget: qt.QWidget) -> Iterator[tuple[str, qt.QWidget]]:
         """
         Generator function that yields all properties from widgets children that can be linked to UI properties.
-        Returns the name of the widget and its widget instance.
+        Returns the name of the widget and its widget instance. Widgets flagged with skipChildren are not visited.
 
         :param qt.QWidget widget: widget to get linked properties from.
         :return: iterated linkable properties.
         :rtype: Iterator[tuple[str, qt.QWidget]]
         """
 
-        for attr in widget.__dict__:
-            if type(getattr(widget, attr)) in SUPPORT_WIDGET_TYPES:
-                yield attr, getattr(widget, attr)
-
-        children = widget.children()
-        for child in children:
-            for attr in child.__dict__:
-                if type(getattr(child, attr)) in SUPPORT_WIDGET_TYPES:
-                    yield attr, getattr(child, attr)
-            for grandchild in self.iterate_linkable_properties(child):
-                yield grandchild
+        widgets_to_visit: deque[qt.QWidget] = deque([widget])
+        while widgets_to_visit:
+            current_widget = widgets_to_visit.popleft()
+            if current_widget.property('skipChildren'):
+                continue
+            for attr, value in current_widget.__dict__.items():
+                if attr.startswith('__'):
+                    continue
+                # only widget types are resolved, so non widget attribute types are not kept in the resolver cache
+                if isinstance(value, qt.QWidget) and _widget_info_for(type(value)) is not None:
+                    yield attr, value
+            widgets_to_visit.extend(current_widget.children())
 
     def populate_widgets(self):
         """
         Makes the connection for all widgets linked to UI properties.
+        Widgets whose Qt prop property was set without calling link_property are registered here.
         """
 
+        linked_widget_ids = {id(widget) for widget in self._property_widgets}
+        for child in qt.iterate_children(self._stacked_widget, skip='skipChildren'):
+            if id(child) in linked_widget_ids:
+                continue
+            ui_property_name = child.property('prop')
+            if ui_property_name is not None:
+                self._register_property_widget(child, ui_property_name)
+
         property_widgets = self.property_widgets()
         for widget in property_widgets:
             modified = False
-            widget_type = type(widget)
-            widget_name = self.widget_property_name(widget)
-            widget_info: UiPropertyWidgetUpdate | None = SUPPORT_WIDGET_TYPES.get(widget_type)
+            widget_info: UiPropertyWidgetUpdate | None = _widget_info_for(type(widget))
             if widget_info:
-                signal = getattr(widget, widget_info.save_signal)
-                signal.connect(self.save_properties)
+                widget_info.signal_getter(widget).connect(self._widget_save_slot(widget))
                 modified = True
 
             if not modified and self._show_warnings:
-                logger.warning(f'Unsupported widget: {widget}. Property: {widget_name}')
+                logger.warning(f'Unsupported widget: {widget}. Property: {self.widget_property_name(widget)}')
 
-    def property_widgets(self) -> list[qt.QWidget]:
+    def property_widgets(self) -> WeakRefList:
         """
-        Returns a list of property widgets added to this tool.
+        Returns the property widgets added to this tool, both the ones linked through link_property and the ones
+        with a Qt prop property found within tool UI when widgets are populated.
+        Returned collection is the one used internally by the tool (not a copy) and it only holds weak references.
+        Widgets are removed from it when their Python wrapper is garbage collected, so it can still contain widgets
+        whose C++ object was already deleted. Use qtutils.is_valid_widget to skip them.
 
-        :return: list of widgets that are linked to a UI property.
-        :rtype: list[qt.QWidget]
+        :return: widgets that are linked to a UI property.
+        :rtype: WeakRefList
         """
 
-        found_widgets: list[qt.QWidget] = []
-        for child in qt.iterate_children(self._stacked_widget, skip='skipChildren'):
-            if child.property('prop') is not None:
-                found_widgets.append(child)
-
-        return found_widgets
+        return self._property_widgets
 
     def widgets_linked_to_property(self, property_name: str) -> list[qt.QWidget]:
         """
@@ -372,14 +521,7 @@ class Tool(qt.QObject):
         :rtype: list[qt.QWidget]
         """
 
-        found_widgets: list[qt.QWidget] = []
-        for child in qt.iterate_children(self._stacked_widget, skip='skipChildren'):
-            child_property = child.property('prop')
-            if child_property is None or child_property != property_name:
-                continue
-            found_widgets.append(child)
-
-        return found_widgets
+        return list(self._widgets_by_prop.get(property_name, ()))
 
     def update_widget(self, widget: qt.QWidget):
         """
@@ -389,21 +531,11 @@ class Tool(qt.QObject):
         """
 
         modified = False
-        widget_type = type(widget)
         widget_name = self.widget_property_name(widget)
-        widget_info: UiPropertyWidgetUpdate | None = SUPPORT_WIDGET_TYPES.get(widget_type)
+        widget_info: UiPropertyWidgetUpdate | None = _widget_info_for(type(widget))
         if widget_info:
-            for i, getset in enumerate(widget_info.getsets):
-                prop = 'value' if i == 0 else getset.getter
-                value = getattr(self.properties[widget_name], prop)
-                setter = getattr(widget, getset.setter)
-                try:
-                    setter(value)
-                except TypeError as err:
-                    raise TypeError(
-                        f'Unable to set widget attribute method: {widget_name}; property: {getset.setter}; '
-                        f'value: {value}: {err}')
-                modified = True
+            widget_info.apply(widget, self._properties[widget_name])
+            modified = True
         if not modified and self._show_warnings:
             logger.warning(f'Unsupported widget: {widget}. Property: {widget_name}')
 
@@ -417,11 +549,9 @@ class Tool(qt.QObject):
         self._stacked_widget.setUpdatesEnabled(False)
         self._block_save = True
 
-        property_widgets = self.widgets_linked_to_property(ui_property_name)
-        for widget in property_widgets:
-            self.update_widget(widget)
-        for widget in property_widgets:
-            widget.blockSignals(False)
+        for widget in self.widgets_linked_to_property(ui_property_name):
+            if qtutils.is_valid_widget(widget):
+                self.update_widget(widget)
 
         self._block_save = False
         self._stacked_widget.setUpdatesEnabled(True)
@@ -435,11 +565,11 @@ class Tool(qt.QObject):
         self._block_save = True
         self._stacked_widget.setUpdatesEnabled(False)
 
-        property_widgets = self.property_widgets()
-        for widget in property_widgets:
-            self.update_widget(widget)
-        for widget in property_widgets:
-            widget.blockSignals(False)
+        update_widget = self.update_widget
+        is_valid_widget = qtutils.is_valid_widget
+        for widget in self.property_widgets():
+            if is_valid_widget(widget):
+                update_widget(widget)
 
         self._stacked_widget.setUpdatesEnabled(True)
         self._block_save = False
@@ -453,25 +583,19 @@ class Tool(qt.QObject):
         :return:
         """
 
-        widget_type = type(widget)
-        widget_name = self.widget_property_name(widget)
-        widget_info: UiPropertyWidgetUpdate | None = SUPPORT_WIDGET_TYPES.get(widget_type)
+        widget_info: UiPropertyWidgetUpdate | None = _widget_info_for(type(widget))
         if widget_info:
-            result: dict[str, Any] = {}
-            for i, getset in enumerate(widget_info.getsets):
-                prop = 'value' if i == 0 else getset.getter
-                result[prop] = getattr(widget, getset.getter)()
+            result: dict[str, Any] = widget_info.read(widget)
 
-            extra_properties: dict = {}
-            if isinstance(widget.property('extraProperties'), dict):
-                extra_properties.update(widget.property('extraProperties'))
-            for k, v in extra_properties.items():
-                result[k] = getattr(widget, v)()
+            extra_properties: dict | None = widget.property('extraProperties')
+            if isinstance(extra_properties, dict):
+                for k, v in extra_properties.items():
+                    result[k] = getattr(widget, v)()
 
             return result
 
         if self._show_warnings:
-            logger.warning(f'Unsupported widget: {widget}. Property: {widget_name}')
+            logger.warning(f'Unsupported widget: {widget}. Property: {self.widget_property_name(widget)}')
 
         return {}
 
@@ -483,16 +607,11 @@ class Tool(qt.QObject):
         if self._block_save:
             return
 
-        property_widgets = self.property_widgets()
-        for widget in property_widgets:
-            property_name = self.widget_property_name(widget)
-            widget_values = self.widget_values(widget)
-            for k, v in widget_values.items():
-                setattr(self.properties[property_name], k, v)
-            for listener in self._listeners.get(property_name, []):
-                for k, v in widget_values.items():
-                    if k == 'value':
-                        listener(v)
+        save_widget = self._save_widget
+        is_valid_widget = qtutils.is_valid_widget
+        for widget in self.property_widgets():
+            if is_valid_widget(widget):
+                save_widget(widget)
 
     def update_property(self, ui_property_name: str, value: Any):
         """
@@ -503,14 +622,16 @@ class Tool(qt.QObject):
         :param Any value: new property value.
         """
 
-        if ui_property_name not in self.properties:
+        if ui_property_name not in self._properties:
             return
-        self.properties[ui_property_name].value = value
+        self._properties[ui_property_name].value = value
 
         self.update_widget_from_property(ui_property_name)
 
-        for listener in self._listeners.get(ui_property_name, []):
-            listener(value)
+        listeners = self._listeners.get(ui_property_name)
+        if listeners:
+            for listener in listeners:
+                listener(value)
 
     def listen(self, ui_property_name: str, listener: callable):
         """
@@ -520,7 +641,22 @@ class Tool(qt.QObject):
         :param Callable listener: function that will be called when UI property internal value is updated.
         """
 
-        self._listeners[ui_property_name] = self._listeners.get(ui_property_name, []) + [listener]
+        listeners = self._listeners.get(ui_property_name)
+        if listeners is None:
+            self._listeners[ui_property_name] = [listener]
+        elif isinstance(listeners, tuple):
+            self._listeners[ui_property_name] = [*listeners, listener]
+        else:
+            listeners.append(listener)
+
+    def freeze_listeners(self):
+        """
+        Converts registered listeners into tuples, which are faster to iterate when listeners are dispatched.
+        Listeners can still be registered after freezing them.
+        """
+
+        for ui_property_name, listeners in self._listeners.items():
+            self._listeners[ui_property_name] = tuple(listeners)
 
     def pre_content_setup(self):
         """
@@ -578,6 +714,63 @@ class Tool(qt.QObject):
 
         return self
 
+    def _register_property_widget(self, widget: qt.QWidget, ui_property_name: str):
+        """
+        Internal function that registers given widget as linked to the UI property with given name.
+
+        :param qt.QWidget widget: widget to register.
+        :param str ui_property_name: name of the UI property widget is linked to.
+        """
+
+        # cache linked property name on the Python side to avoid Qt property lookups when saving/updating widgets
+        widget._ui_prop_name = ui_property_name
+        self._property_widgets.append(widget)
+        self._widgets_by_prop.setdefault(ui_property_name, WeakRefList()).append(widget)
+
+    def _save_widget(self, widget: qt.QWidget):
+        """
+        Internal function that saves the values of the given widget into its linked UI property and notifies the
+        listeners of that property. Callers are responsible for checking whether saving is blocked. Given widget must
+        have been registered as a property widget.
+
+        :param qt.QWidget widget: widget to save values of.
+        """
+
+        property_name = widget._ui_prop_name
+        values = self.widget_values(widget)
+        ui_property = self._properties[property_name]
+        for k, v in values.items():
+            setattr(ui_property, k, v)
+        listeners = self._listeners.get(property_name)
+        if listeners and 'value' in values:
+            value = values['value']
+            for listener in listeners:
+                listener(value)
+
+    def _widget_save_slot(self, widget: qt.QWidget) -> Callable:
+        """
+        Internal function that returns the slot that is connected to the save signal of the given widget. Slot only
+        saves the property linked to that widget, instead of saving all properties each time a widget changes.
+        Slot only holds weak references to both the tool and the widget, so the connection does not keep any of them
+        alive.
+
+        :param qt.QWidget widget: widget to create save slot for.
+        :return: save slot function.
+        :rtype: Callable
+        """
+
+        tool_ref = weakref.ref(self)
+        widget_ref = weakref.ref(widget)
+
+        def _save_widget_slot(*args):
+            tool = tool_ref()
+            slot_widget = widget_ref()
+            if tool is None or slot_widget is None or tool._block_save:
+                return
+            tool._save_widget(slot_widget)
+
+        return _save_widget_slot
+
     def _run_teardown(self):
         """
         Internal function that tries to tear down the tool in a safe way.